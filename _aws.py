@@ -0,0 +1,41 @@
+"""
+Shared boto3 session and AgentCore clients for the example scripts
+
+One Session per process resolves credentials once; the memoized clients keep
+their connection pools, so later calls reuse the same TLS connections.
+"""
+from functools import lru_cache
+
+import boto3
+from botocore.config import Config
+
+REGION = "us-west-2"
+
+# Adaptive retries back off client-side when AgentCore starts throttling
+CLIENT_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 5},
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=30,
+)
+
+SESSION = boto3.Session(region_name=REGION)
+
+
+@lru_cache(maxsize=None)
+def get_control_client():
+    """AgentCore control plane client (create/update/delete memory)."""
+    return SESSION.client("bedrock-agentcore-control", config=CLIENT_CONFIG)
+
+
+@lru_cache(maxsize=None)
+def get_data_client():
+    """AgentCore data plane client (events and memory records)."""
+    return SESSION.client("bedrock-agentcore", config=CLIENT_CONFIG)
+
+
+@lru_cache(maxsize=None)
+def get_runtime_client():
+    """Bedrock runtime client (model invocation, e.g. embeddings)."""
+    return SESSION.client("bedrock-runtime", config=CLIENT_CONFIG)
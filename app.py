@@ -10,15 +10,19 @@ Target Audience: Data Scientists, ML/AI Engineers, AWS Architects
 """
 
 import asyncio
+import functools
 import json
 import os
 import time
-from datetime import datetime
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
 
 import boto3
 import streamlit as st
+from botocore.config import Config
 from strands import Agent, tool
+from strands.models import BedrockModel
 from bedrock_agentcore.memory.integrations.strands.session_manager import (
     AgentCoreMemorySessionManager,
 )
@@ -27,6 +31,13 @@ from bedrock_agentcore.memory.integrations.strands.config import (
     RetrievalConfig,
 )
 
+from semantic_cache import SemanticCache, titan_embedder
+
+try:
+    import orjson
+except ImportError:  # optional C-accelerated JSON; stdlib json is the fallback
+    orjson = None
+
 # Page configuration
 st.set_page_config(
     page_title="Bedrock Agent Memory Management",
@@ -39,6 +50,59 @@ st.set_page_config(
 MEMORY_CONFIG_FILE = "memory_config.json"
 AWS_REGION = "eu-west-1"
 AWS_PROFILE = "default"
+BOTO_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 5},
+    tcp_keepalive=True,
+    max_pool_connections=64,
+    connect_timeout=3,
+    read_timeout=30,
+)
+# Model generation can go quiet for longer than a memory API call
+MODEL_BOTO_CONFIG = BOTO_CONFIG.merge(Config(read_timeout=120))
+RETRIEVAL_WORKERS = 4
+INGEST_WORKERS = 4
+EVENT_BATCH_SIZE = 10
+# Messages kept in session state for display; AgentCore holds the full history
+CHAT_HISTORY_LIMIT = 40
+OLDER_EVENTS_PAGE_SIZE = 10
+EVENTS_PAGE_SIZE = 20
+EVENTS_MAX_ITEMS = 100
+SEMANTIC_CACHE_THRESHOLD = 0.85
+# Kept byte-identical across turns and sessions so Bedrock can cache it.
+# Bedrock only caches a prefix that reaches the model's minimum size (1,024
+# tokens for Claude Sonnet); until the system prompt and tool schema grow
+# that long, the cache points are accepted but nothing is cached.
+AGENT_SYSTEM_PROMPT = (
+    "You are a helpful assistant with memory capabilities. "
+    "Use context about the user to personalize responses. "
+    "Be concise and friendly."
+)
+# Long-term strategy configs by UI key, built for a given actor id
+STRATEGY_FACTORIES = {
+    "user_preference": lambda actor_id: {
+        "userPreferenceMemoryStrategy": {
+            "name": "PreferenceLearner",
+            "namespaces": [f"/preferences/{actor_id}"],
+        }
+    },
+    "summary": lambda actor_id: {
+        "summaryMemoryStrategy": {
+            "name": "SessionSummarizer",
+            "namespaces": [f"/summaries/{actor_id}/{{sessionId}}"],
+        }
+    },
+    "semantic": lambda actor_id: {
+        "semanticMemoryStrategy": {
+            "name": "FactExtractor",
+            "namespaces": [f"/facts/{actor_id}"],
+        }
+    },
+}
+PRESET_QUERIES = (
+    "What do I like to drink?",
+    "What's my profession?",
+    "What tools do I use?",
+)
 
 # Initialize session state
 if "memory_id" not in st.session_state:
@@ -49,44 +113,122 @@ if "session_id" not in st.session_state:
     st.session_state.session_id = f"session-{int(time.time())}"
 if "chat_history" not in st.session_state:
     st.session_state.chat_history = []
+if "chat_history_truncated" not in st.session_state:
+    st.session_state.chat_history_truncated = False
+if "older_events" not in st.session_state:
+    st.session_state.older_events = None
 if "agent" not in st.session_state:
     st.session_state.agent = None
+    st.session_state.agent_key = None
 if "memory_status" not in st.session_state:
     st.session_state.memory_status = "Not Created"
 
 
 # Tool definitions
+@functools.lru_cache(maxsize=1)
+def format_current_time(half_second: int) -> str:
+    """Format the local time; memoized per 500 ms bucket of ``time.monotonic()``."""
+    return time.strftime("%I:%M:%S %p")
+
+
 @tool
 def get_time(timezone: str = "UTC") -> str:
     """Get the current time for a timezone."""
-    current_time = datetime.now().strftime("%I:%M:%S %p")
+    current_time = format_current_time(int(time.monotonic() * 2))
     return f"The current time in {timezone} is {current_time}"
 
 
 # Utility functions
+@st.cache_resource
 def get_boto3_session() -> boto3.Session:
-    """Create boto3 session with configured profile."""
+    """Create boto3 session with configured profile (shared across reruns)."""
     return boto3.Session(profile_name=AWS_PROFILE, region_name=AWS_REGION)
 
 
+@st.cache_resource
+def get_control_client():
+    """Return the shared AgentCore control plane client."""
+    return get_boto3_session().client("bedrock-agentcore-control", config=BOTO_CONFIG)
+
+
+@st.cache_resource
+def get_data_client():
+    """Return the shared AgentCore data plane client."""
+    return get_boto3_session().client("bedrock-agentcore", config=BOTO_CONFIG)
+
+
+@st.cache_resource
+def get_runtime_client():
+    """Return the shared Bedrock runtime client."""
+    return get_boto3_session().client("bedrock-runtime", config=BOTO_CONFIG)
+
+
+@st.cache_resource
+def get_semantic_cache() -> SemanticCache:
+    """Return the process-wide semantic cache for long-term memory queries."""
+    return SemanticCache(
+        titan_embedder(get_runtime_client()),
+        threshold=SEMANTIC_CACHE_THRESHOLD,
+        maxsize=512,
+        ttl=300,
+    )
+
+
+@st.cache_resource
+def get_bedrock_model(
+    cache_prompt: bool = True, latency_optimized: bool = False
+) -> BedrockModel:
+    """Return a Bedrock model whose runtime client is pooled across agents and turns.
+
+    With ``cache_prompt`` the tool schema is followed by a Bedrock cache point.
+    With ``latency_optimized`` Converse requests carry
+    ``performanceConfig={"latency": "optimized"}`` (supported models only).
+    """
+    model_params = {}
+    if cache_prompt:
+        model_params["cache_tools"] = "default"
+    if latency_optimized:
+        # additional_args are merged verbatim into the ConverseStream request
+        model_params["additional_args"] = {"performanceConfig": {"latency": "optimized"}}
+
+    return BedrockModel(
+        boto_session=get_boto3_session(),
+        boto_client_config=MODEL_BOTO_CONFIG,
+        **model_params,
+    )
+
+
+@st.cache_data(show_spinner=False)
+def load_memory_config_cached(mtime: float) -> Dict:
+    """Parse the memory configuration file; cached per modification time."""
+    with open(MEMORY_CONFIG_FILE, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
 def load_memory_config() -> Optional[Dict]:
-    """Load memory configuration from file."""
-    if os.path.exists(MEMORY_CONFIG_FILE):
-        with open(MEMORY_CONFIG_FILE, "r") as f:
-            return json.load(f)
-    return None
+    """Load memory configuration from file, re-reading only when it changes."""
+    try:
+        mtime = os.path.getmtime(MEMORY_CONFIG_FILE)
+    except OSError:
+        return None
+    return load_memory_config_cached(mtime)
 
 
 def save_memory_config(memory_id: str):
     """Save memory configuration to file."""
-    with open(MEMORY_CONFIG_FILE, "w") as f:
-        json.dump({"memory_id": memory_id}, f, indent=2)
+    config = {"memory_id": memory_id}
+    if orjson:
+        data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(config, indent=2).encode()
+    with open(MEMORY_CONFIG_FILE, "wb") as f:
+        f.write(data)
 
 
 def create_memory_resource(name: str, description: str, expiry_days: int) -> str:
     """Create a new memory resource in Bedrock AgentCore."""
-    session = get_boto3_session()
-    control_client = session.client("bedrock-agentcore-control")
+    control_client = get_control_client()
 
     response = control_client.create_memory(
         name=name,
@@ -100,57 +242,34 @@ def create_memory_resource(name: str, description: str, expiry_days: int) -> str
 
 
 def wait_for_memory_active(memory_id: str, max_wait: int = 60) -> bool:
-    """Wait for memory resource to become active."""
-    session = get_boto3_session()
-    control_client = session.client("bedrock-agentcore-control")
+    """Wait for memory resource to become active, polling with exponential backoff."""
+    control_client = get_control_client()
 
-    start_time = time.time()
-    while time.time() - start_time < max_wait:
+    deadline = time.monotonic() + max_wait
+    attempt = 0
+    while True:
         response = control_client.get_memory(memoryId=memory_id)
         status = response["memory"]["status"]
         if status == "ACTIVE":
             return True
-        time.sleep(2)
-    return False
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        # 0.5s, 1s, 2s, 4s, 4s, ... but never past the deadline
+        time.sleep(min(0.5 * 2**attempt, 4.0, remaining))
+        attempt += 1
 
 
 def add_longterm_strategies(memory_id: str, strategies: List[str]):
     """Add long-term memory strategies to existing memory."""
-    session = get_boto3_session()
-    control_client = session.client("bedrock-agentcore-control")
+    control_client = get_control_client()
 
-    strategy_configs = []
     actor_id = st.session_state.actor_id
-
-    if "user_preference" in strategies:
-        strategy_configs.append(
-            {
-                "userPreferenceMemoryStrategy": {
-                    "name": "PreferenceLearner",
-                    "namespaces": [f"/preferences/{actor_id}"],
-                }
-            }
-        )
-
-    if "summary" in strategies:
-        strategy_configs.append(
-            {
-                "summaryMemoryStrategy": {
-                    "name": "SessionSummarizer",
-                    "namespaces": [f"/summaries/{actor_id}/{{sessionId}}"],
-                }
-            }
-        )
-
-    if "semantic" in strategies:
-        strategy_configs.append(
-            {
-                "semanticMemoryStrategy": {
-                    "name": "FactExtractor",
-                    "namespaces": [f"/facts/{actor_id}"],
-                }
-            }
-        )
+    strategy_configs = [
+        factory(actor_id)
+        for key, factory in STRATEGY_FACTORIES.items()
+        if key in strategies
+    ]
 
     if strategy_configs:
         control_client.update_memory(
@@ -162,52 +281,99 @@ def add_longterm_strategies(memory_id: str, strategies: List[str]):
 def add_events_to_memory(
     memory_id: str, actor_id: str, session_id: str, events: List[Dict]
 ):
-    """Add conversational events to memory."""
-    session = get_boto3_session()
-    data_client = session.client("bedrock-agentcore")
+    """Add conversational events to memory.
 
-    payload = []
-    for event in events:
-        payload.append(
+    Small conversations go in a single ``create_event``. Larger ones are split
+    into batches of EVENT_BATCH_SIZE turns sent concurrently, each stamped one
+    millisecond after the previous batch so the conversation order is kept.
+    """
+    data_client = get_data_client()
+    # Aware UTC: botocore serializes naive datetimes as if they were UTC
+    start = datetime.now(timezone.utc)
+
+    def send(batch_index: int, batch: List[Dict]):
+        payload = [
             {
                 "conversational": {
                     "content": {"text": event["text"]},
                     "role": event["role"],
                 }
             }
+            for event in batch
+        ]
+
+        data_client.create_event(
+            memoryId=memory_id,
+            actorId=actor_id,
+            sessionId=session_id,
+            eventTimestamp=start + timedelta(milliseconds=batch_index),
+            payload=payload,
         )
 
-    data_client.create_event(
-        memoryId=memory_id,
-        actorId=actor_id,
-        sessionId=session_id,
-        eventTimestamp=datetime.now(),
-        payload=payload,
-    )
+    if len(events) <= EVENT_BATCH_SIZE:
+        send(0, events)
+    else:
+        batches = [
+            events[i : i + EVENT_BATCH_SIZE]
+            for i in range(0, len(events), EVENT_BATCH_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=INGEST_WORKERS) as executor:
+            # list() surfaces the first failed batch as an exception
+            list(executor.map(send, range(len(batches)), batches))
+
+    get_semantic_cache().clear()
 
 
 def retrieve_longterm_memories(
     memory_id: str, actor_id: str, query: str, top_k: int = 3
 ) -> List[Dict]:
-    """Retrieve long-term memories using semantic search."""
-    session = get_boto3_session()
-    data_client = session.client("bedrock-agentcore")
+    """Retrieve long-term memories using semantic search.
+
+    Results are served from the semantic cache when a sufficiently similar
+    query was already answered for the same memory, actor and namespace.
+    """
+    data_client = get_data_client()
 
     namespace = f"/preferences/{actor_id}"
 
-    response = data_client.retrieve_memory_records(
-        memoryId=memory_id,
-        namespace=namespace,
-        searchCriteria={"searchQuery": query, "topK": top_k},
+    def fetch() -> List[Dict]:
+        response = data_client.retrieve_memory_records(
+            memoryId=memory_id,
+            namespace=namespace,
+            searchCriteria={"searchQuery": query, "topK": top_k},
+        )
+        return response.get("memoryRecordSummaries", [])
+
+    return get_semantic_cache().get_or_fetch(
+        query, fetch, scope=(memory_id, actor_id, namespace, top_k)
     )
 
-    return response.get("memoryRecordSummaries", [])
+
+def retrieve_longterm_memories_batch(
+    memory_id: str, actor_id: str, queries: List[str], top_k: int = 3
+) -> List[List[Dict]]:
+    """Retrieve long-term memories for several queries concurrently."""
+    if len(queries) == 1:
+        return [retrieve_longterm_memories(memory_id, actor_id, queries[0], top_k)]
+
+    # Resolve the shared clients on the script thread; botocore clients are
+    # thread-safe, so the workers only overlap the network round-trips.
+    get_data_client()
+    get_semantic_cache()
+    with ThreadPoolExecutor(max_workers=RETRIEVAL_WORKERS) as executor:
+        return list(
+            executor.map(
+                lambda query: retrieve_longterm_memories(
+                    memory_id, actor_id, query, top_k
+                ),
+                queries,
+            )
+        )
 
 
 def delete_memory_resource(memory_id: str):
     """Delete memory resource and clean up configuration."""
-    session = get_boto3_session()
-    control_client = session.client("bedrock-agentcore-control")
+    control_client = get_control_client()
 
     try:
         control_client.delete_memory(memoryId=memory_id)
@@ -219,11 +385,101 @@ def delete_memory_resource(memory_id: str):
         return False
 
 
+def run_async(coro):
+    """Run a coroutine on this browser session's persistent event loop.
+
+    Reusing one loop avoids the setup/teardown of ``asyncio.run`` on every turn
+    and keeps loop-bound async resources of the agent alive between turns.
+    """
+    loop = st.session_state.get("event_loop")
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        st.session_state.event_loop = loop
+    return loop.run_until_complete(coro)
+
+
+def list_session_events_page(
+    memory_id: str,
+    actor_id: str,
+    session_id: str,
+    next_token: Optional[str] = None,
+    max_results: int = OLDER_EVENTS_PAGE_SIZE,
+) -> Tuple[List[Dict], Optional[str]]:
+    """Fetch one page of short-term memory events and the token for the next."""
+    params = {
+        "memoryId": memory_id,
+        "actorId": actor_id,
+        "sessionId": session_id,
+        "maxResults": max_results,
+    }
+    if next_token:
+        params["nextToken"] = next_token
+
+    response = get_data_client().list_events(**params)
+    return response.get("events", []), response.get("nextToken")
+
+
+def decode_chat_messages(events: List[Dict]) -> List[Dict]:
+    """Decode agent session events into chat messages, newest first.
+
+    The session manager stores each Strands message as a JSON-encoded
+    ``SessionMessage``; plain-text events are shown as they are. Tool-use and
+    tool-result messages are left out, as they are in the live chat.
+    """
+    messages = []
+    for event in events:
+        for item in event.get("payload", []):
+            if "conversational" in item:
+                conv = item["conversational"]
+                text = conv.get("content", {}).get("text", "")
+                role = conv.get("role", "").lower()
+            elif "blob" in item:
+                try:
+                    text, role = json.loads(item["blob"])
+                except (TypeError, ValueError):
+                    continue
+            else:
+                continue
+
+            try:
+                message = json.loads(text)["message"]
+            except (TypeError, ValueError, KeyError):
+                message = {"role": role, "content": [{"text": text}]}
+
+            content = message.get("content", [])
+            if any("toolUse" in block or "toolResult" in block for block in content):
+                continue
+            text = "".join(block["text"] for block in content if "text" in block)
+            if text:
+                role = "user" if message.get("role", "").lower() == "user" else "assistant"
+                messages.append({"role": role, "content": text})
+    return messages
+
+
+def append_chat_message(role: str, content: str):
+    """Append a chat message, keeping only the last CHAT_HISTORY_LIMIT in state."""
+    history = st.session_state.chat_history
+    history.append({"role": role, "content": content})
+    if len(history) > CHAT_HISTORY_LIMIT:
+        del history[:-CHAT_HISTORY_LIMIT]
+        st.session_state.chat_history_truncated = True
+
+
+def reset_chat():
+    """Drop the displayed conversation and the agent bound to it."""
+    st.session_state.chat_history = []
+    st.session_state.chat_history_truncated = False
+    st.session_state.older_events = None
+    st.session_state.agent = None
+
+
 async def create_agent_with_memory(
     memory_id: str,
     actor_id: str,
     session_id: str,
     enable_longterm: bool = False,
+    cache_prompt: bool = True,
+    latency_optimized: bool = False,
 ) -> Agent:
     """Create an agent with memory session manager."""
     # Create memory configuration
@@ -241,22 +497,27 @@ async def create_agent_with_memory(
     memory_config = AgentCoreMemoryConfig(**memory_config_params)
 
     # Create session manager
-    session = get_boto3_session()
     session_manager = AgentCoreMemorySessionManager(
         agentcore_memory_config=memory_config,
         region_name=AWS_REGION,
-        boto3_session=session,
+        boto_session=get_boto3_session(),
+        boto_client_config=BOTO_CONFIG,
     )
 
+    # A cache point after the static system prompt lets Bedrock reuse it
+    system_prompt = AGENT_SYSTEM_PROMPT
+    if cache_prompt:
+        system_prompt = [
+            {"text": AGENT_SYSTEM_PROMPT},
+            {"cachePoint": {"type": "default"}},
+        ]
+
     # Create agent
     agent = Agent(
         name="MemoryEnabledAgent",
+        model=get_bedrock_model(cache_prompt, latency_optimized),
         tools=[get_time],
-        system_prompt=(
-            "You are a helpful assistant with memory capabilities. "
-            "Use context about the user to personalize responses. "
-            "Be concise and friendly."
-        ),
+        system_prompt=system_prompt,
         session_manager=session_manager,
         callback_handler=None,
     )
@@ -264,6 +525,50 @@ async def create_agent_with_memory(
     return agent
 
 
+async def stream_agent_response(agent: Agent, prompt: str, placeholder) -> str:
+    """Stream the agent's answer into ``placeholder`` and return the final text."""
+    chunks = []
+    result = None
+    async for event in agent.stream_async(prompt):
+        if "data" in event:
+            chunks.append(event["data"])
+            placeholder.markdown("".join(chunks) + "▌")
+        elif "result" in event:
+            result = event["result"]
+
+    response = str(result) if result is not None else "".join(chunks)
+    placeholder.markdown(response)
+    return response
+
+
+def get_agent(
+    memory_id: str,
+    actor_id: str,
+    session_id: str,
+    enable_longterm: bool,
+    latency_optimized: bool = False,
+) -> Agent:
+    """Return this browser session's agent, built once and reused across turns.
+
+    Only one agent is kept per browser session: when any setting changes, the
+    old agent is dropped and the new one restores the conversation from
+    AgentCore, so two agents never hold diverging histories of one session.
+    """
+    key = (memory_id, actor_id, session_id, enable_longterm, latency_optimized)
+    if st.session_state.agent is None or st.session_state.agent_key != key:
+        st.session_state.agent = run_async(
+            create_agent_with_memory(
+                memory_id,
+                actor_id,
+                session_id,
+                enable_longterm,
+                latency_optimized=latency_optimized,
+            )
+        )
+        st.session_state.agent_key = key
+    return st.session_state.agent
+
+
 # UI Components
 def render_sidebar():
     """Render sidebar with configuration and controls."""
@@ -289,14 +594,16 @@ def render_sidebar():
     st.session_state.actor_id = st.sidebar.text_input(
         "Actor ID (User)", value=st.session_state.actor_id
     )
-    st.session_state.session_id = st.sidebar.text_input(
+    session_id = st.sidebar.text_input(
         "Session ID", value=st.session_state.session_id
     )
+    if session_id != st.session_state.session_id:
+        st.session_state.session_id = session_id
+        reset_chat()
 
     if st.sidebar.button("🔄 New Session ID"):
         st.session_state.session_id = f"session-{int(time.time())}"
-        st.session_state.chat_history = []
-        st.session_state.agent = None
+        reset_chat()
         st.rerun()
 
     st.sidebar.markdown("---")
@@ -389,7 +696,7 @@ def render_memory_setup_tab():
         with col1:
             strategies = st.multiselect(
                 "Select Strategies to Enable",
-                ["user_preference", "summary", "semantic"],
+                list(STRATEGY_FACTORIES),
                 default=["user_preference"],
                 help="User preferences are recommended for personalization",
             )
@@ -485,23 +792,29 @@ def render_shortterm_memory_tab():
     # Retrieve events
     st.subheader("View Short-Term Memory")
     if st.button("Retrieve Current Session Events"):
-        session = get_boto3_session()
-        data_client = session.client("bedrock-agentcore")
+        data_client = get_data_client()
 
         try:
-            response = data_client.list_events(
+            paginator = data_client.get_paginator("list_events")
+            pages = paginator.paginate(
                 memoryId=st.session_state.memory_id,
                 actorId=st.session_state.actor_id,
                 sessionId=st.session_state.session_id,
+                PaginationConfig={
+                    "PageSize": EVENTS_PAGE_SIZE,
+                    "MaxItems": EVENTS_MAX_ITEMS,
+                },
             )
 
-            events = response.get("events", [])
-
-            if events:
-                st.success(f"Found {len(events)} events in current session")
+            # Render each page as it arrives instead of buffering every event
+            status = st.empty()
+            count = 0
+            for page in pages:
+                for event in page.get("events", []):
+                    count += 1
+                    status.success(f"Found {count} events in current session")
 
-                for i, event in enumerate(events, 1):
-                    with st.expander(f"Event {i}"):
+                    with st.expander(f"Event {count}"):
                         payload = event.get("payload", [])
                         for turn in payload:
                             if "conversational" in turn:
@@ -513,8 +826,9 @@ def render_shortterm_memory_tab():
                                     st.markdown(f"**👤 User:** {text}")
                                 else:
                                     st.markdown(f"**🤖 Assistant:** {text}")
-            else:
-                st.info("No events found in current session")
+
+            if not count:
+                status.info("No events found in current session")
 
         except Exception as e:
             st.error(f"Error retrieving events: {str(e)}")
@@ -590,44 +904,88 @@ def render_longterm_memory_tab():
     st.markdown("---")
     st.subheader("Quick Queries")
 
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        if st.button("What do I like to drink?"):
-            st.session_state.preset_query = "What do I like to drink?"
-            st.rerun()
+    cols = st.columns(len(PRESET_QUERIES) + 1)
 
-    with col2:
-        if st.button("What's my profession?"):
-            st.session_state.preset_query = "What's my profession?"
-            st.rerun()
+    for col, preset in zip(cols, PRESET_QUERIES):
+        with col:
+            if st.button(preset):
+                st.session_state.preset_queries = [preset]
+                st.rerun()
 
-    with col3:
-        if st.button("What tools do I use?"):
-            st.session_state.preset_query = "What tools do I use?"
+    with cols[-1]:
+        if st.button("⚡ Run All"):
+            st.session_state.preset_queries = list(PRESET_QUERIES)
             st.rerun()
 
-    if "preset_query" in st.session_state:
-        query = st.session_state.preset_query
-        del st.session_state.preset_query
+    if "preset_queries" in st.session_state:
+        queries = st.session_state.preset_queries
+        del st.session_state.preset_queries
 
-        with st.spinner(f"Searching for: {query}"):
+        with st.spinner(f"Searching for: {', '.join(queries)}"):
             try:
-                records = retrieve_longterm_memories(
-                    st.session_state.memory_id, st.session_state.actor_id, query, 3
+                results = retrieve_longterm_memories_batch(
+                    st.session_state.memory_id, st.session_state.actor_id, queries, 3
                 )
 
-                if records:
-                    for i, record in enumerate(records, 1):
-                        content = record.get("content", {})
-                        st.info(f"**Result {i}:** {content.get('text', 'N/A')}")
-                else:
-                    st.warning("No results found")
+                for query, records in zip(queries, results):
+                    if len(queries) > 1:
+                        st.markdown(f"**{query}**")
+                    if records:
+                        for i, record in enumerate(records, 1):
+                            content = record.get("content", {})
+                            st.info(f"**Result {i}:** {content.get('text', 'N/A')}")
+                    else:
+                        st.warning("No results found")
 
             except Exception as e:
                 st.error(f"Error: {str(e)}")
 
 
+def render_older_messages():
+    """Render older session messages fetched page by page from short-term memory."""
+    with st.expander("📜 Older messages (from short-term memory)"):
+        older = st.session_state.older_events
+        if older is None or older["next_token"]:
+            if st.button("Load older"):
+                if older is None:
+                    # list_events is newest first; the newest messages are
+                    # already shown in the chat below
+                    older = {
+                        "messages": [],
+                        "next_token": None,
+                        "skip": len(st.session_state.chat_history),
+                    }
+                try:
+                    page = []
+                    skip, next_token = older["skip"], older["next_token"]
+                    while True:
+                        events, next_token = list_session_events_page(
+                            st.session_state.memory_id,
+                            st.session_state.actor_id,
+                            st.session_state.session_id,
+                            next_token=next_token,
+                        )
+                        messages = decode_chat_messages(events)
+                        page.extend(messages[skip:])
+                        skip = max(0, skip - len(messages))
+                        if page or not next_token:
+                            break
+                    # Each page is older than everything loaded so far
+                    older = {
+                        "messages": page[::-1] + older["messages"],
+                        "next_token": next_token,
+                        "skip": skip,
+                    }
+                    st.session_state.older_events = older
+                except Exception as e:
+                    st.error(f"Error loading older messages: {str(e)}")
+
+        if older:
+            for message in older["messages"]:
+                with st.chat_message(message["role"]):
+                    st.markdown(message["content"])
+
+
 def render_agent_chat_tab():
     """Render interactive agent chat tab."""
     st.header("4️⃣ Interactive Agent with Memory")
@@ -644,6 +1002,12 @@ def render_agent_chat_tab():
         st.warning("⚠️ Please create a memory resource in the Setup tab first")
         return
 
+    render_chat_fragment()
+
+
+@st.fragment
+def render_chat_fragment():
+    """Render chat controls, history and input; reruns without the other tabs."""
     # Memory mode selection
     col1, col2 = st.columns([3, 1])
 
@@ -653,16 +1017,23 @@ def render_agent_chat_tab():
             value=True,
             help="Automatically inject relevant long-term memories into context",
         )
+        latency_optimized = st.checkbox(
+            "⚡ Latency-optimized inference",
+            value=False,
+            help="Request Bedrock latency-optimized inference (supported models only)",
+        )
 
     with col2:
         if st.button("Clear Chat"):
-            st.session_state.chat_history = []
-            st.session_state.agent = None
-            st.rerun()
+            reset_chat()
+            st.rerun(scope="fragment")
 
     # Display chat history
     st.markdown("---")
 
+    if st.session_state.chat_history_truncated:
+        render_older_messages()
+
     chat_container = st.container()
 
     with chat_container:
@@ -675,44 +1046,36 @@ def render_agent_chat_tab():
 
     if user_input:
         # Add user message to history
-        st.session_state.chat_history.append({"role": "user", "content": user_input})
+        append_chat_message("user", user_input)
 
         with st.chat_message("user"):
             st.markdown(user_input)
 
         # Get agent response
         with st.chat_message("assistant"):
-            with st.spinner("Thinking..."):
-                try:
-                    # Create agent if not exists
-                    if st.session_state.agent is None:
-                        st.session_state.agent = asyncio.run(
-                            create_agent_with_memory(
-                                st.session_state.memory_id,
-                                st.session_state.actor_id,
-                                st.session_state.session_id,
-                                enable_longterm,
-                            )
-                        )
-
-                    # Get response
-                    response = asyncio.run(
-                        st.session_state.agent.invoke_async(user_input)
-                    )
+            placeholder = st.empty()
+            placeholder.markdown("_Thinking..._")
+            try:
+                agent = get_agent(
+                    st.session_state.memory_id,
+                    st.session_state.actor_id,
+                    st.session_state.session_id,
+                    enable_longterm,
+                    latency_optimized,
+                )
 
-                    st.markdown(response)
+                # Stream the response so the first tokens show up immediately
+                response = run_async(
+                    stream_agent_response(agent, user_input, placeholder)
+                )
 
-                    # Add to history
-                    st.session_state.chat_history.append(
-                        {"role": "assistant", "content": response}
-                    )
+                # Add to history
+                append_chat_message("assistant", response)
 
-                except Exception as e:
-                    error_msg = f"Error: {str(e)}"
-                    st.error(error_msg)
-                    st.session_state.chat_history.append(
-                        {"role": "assistant", "content": error_msg}
-                    )
+            except Exception as e:
+                error_msg = f"Error: {str(e)}"
+                placeholder.error(error_msg)
+                append_chat_message("assistant", error_msg)
 
 
 # Main application
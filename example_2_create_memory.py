@@ -1,11 +1,12 @@
 """
 Example 2: Create a Memory resource in AgentCore Memory using Boto3
 """
-import boto3
 import json
 
+from _aws import get_control_client
+
 # Initialize AgentCore control client
-control_client = boto3.client("bedrock-agentcore-control", region_name="us-west-2")
+control_client = get_control_client()
 
 # Create memory
 response = control_client.create_memory(
@@ -1,22 +1,27 @@
 """
 Example 3: Add events to Memory and retrieve them
 """
-import boto3
-import json
 from datetime import datetime
 import time
 
+try:
+    import orjson
+except ImportError:  # stdlib fallback; json.loads also accepts bytes
+    import json as orjson
+
+from _aws import get_control_client, get_data_client
+
 # Load memory configuration
-with open("memory_config.json", "r") as f:
-    config = json.load(f)
+with open("memory_config.json", "rb") as f:
+    config = orjson.loads(f.read())
 
 memory_id = config["memory_id"]
 actor_id = "user-1"
 session_id = "session-1"
 
 # Initialize clients
-control_client = boto3.client("bedrock-agentcore-control", region_name="us-west-2")
-data_client = boto3.client("bedrock-agentcore", region_name="us-west-2")
+control_client = get_control_client()
+data_client = get_data_client()
 
 # Wait for memory to become active
 print("Waiting for memory to become active...")
@@ -2,27 +2,45 @@
 Example 4: Agent with AgentCore Memory Session Manager
 """
 import asyncio
-import json
-from datetime import datetime
-from strands import Agent, tool
-from bedrock_agentcore.memory.integrations.strands.session_manager import AgentCoreMemorySessionManager
-from bedrock_agentcore.memory.integrations.strands.config import AgentCoreMemoryConfig
+from functools import lru_cache
+import time
 
+try:
+    import orjson
+except ImportError:  # stdlib fallback; json.loads also accepts bytes
+    import json as orjson
 
-@tool
-def get_time(timezone: str = "UTC") -> str:
-    """Get the current time for a timezone."""
-    current_time = datetime.now().strftime("%I:%M:%S %p")
-    return f"The current time in {timezone} is {current_time}"
+
+@lru_cache(maxsize=1)
+def format_current_time(second: int) -> str:
+    """Format a local time; repeated tool calls within one second reuse the string."""
+    return time.strftime("%I:%M:%S %p", time.localtime(second))
 
 
 async def main():
     # Load memory configuration
-    with open("memory_config.json", "r") as f:
-        config = json.load(f)
+    with open("memory_config.json", "rb") as f:
+        config = orjson.loads(f.read())
 
     memory_id = config["memory_id"]
 
+    print("Time Agent with Memory CLI (type 'quit' to exit)")
+    print("-" * 60)
+    print("Conversation is automatically saved to AgentCore Memory\n")
+
+    # Heavy SDK imports are deferred until after the banner is shown
+    from strands import Agent, tool
+    from bedrock_agentcore.memory.integrations.strands.session_manager import AgentCoreMemorySessionManager
+    from bedrock_agentcore.memory.integrations.strands.config import AgentCoreMemoryConfig
+
+    from _aws import CLIENT_CONFIG, REGION, SESSION
+
+    @tool
+    def get_time(timezone: str = "UTC") -> str:
+        """Get the current time for a timezone."""
+        current_time = format_current_time(int(time.time()))
+        return f"The current time in {timezone} is {current_time}"
+
     # Create memory configuration
     memory_config = AgentCoreMemoryConfig(
         memory_id=memory_id,
@@ -33,7 +51,9 @@ async def main():
     # Create memory session manager
     session_manager = AgentCoreMemorySessionManager(
         agentcore_memory_config=memory_config,
-        region_name="us-west-2",
+        region_name=REGION,
+        boto_session=SESSION,
+        boto_client_config=CLIENT_CONFIG,
     )
 
     # Create agent with memory
@@ -45,10 +65,6 @@ async def main():
         callback_handler=None,
     )
 
-    print("Time Agent with Memory CLI (type 'quit' to exit)")
-    print("-" * 60)
-    print("Conversation is automatically saved to AgentCore Memory\n")
-
     while True:
         user_input = input("\nYou: ").strip()
 
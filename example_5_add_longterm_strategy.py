@@ -1,17 +1,21 @@
 """
 Example 5: Add long-term strategies to existing memory
 """
-import boto3
-import json
+try:
+    import orjson
+except ImportError:  # stdlib fallback; json.loads also accepts bytes
+    import json as orjson
+
+from _aws import get_control_client
 
 # Load existing memory configuration
-with open("memory_config.json", "r") as f:
-    config = json.load(f)
+with open("memory_config.json", "rb") as f:
+    config = orjson.loads(f.read())
 
 memory_id = config["memory_id"]
 
 # Initialize AgentCore control client
-control_client = boto3.client("bedrock-agentcore-control", region_name="us-west-2")
+control_client = get_control_client()
 
 # Add long-term strategies to existing memory
 response = control_client.update_memory(
@@ -1,89 +1,206 @@
 """
 Example 6: Add events and retrieve top K long-term memories
 """
-import boto3
-import json
+import asyncio
 from datetime import datetime
+import functools
+import hashlib
+import json
+import os
 import time
 
-# Load memory configuration
-with open("memory_config.json", "r") as f:
-    config = json.load(f)
-
-memory_id = config["memory_id"]
-actor_id = "user-1"
-session_id = "session-3"
-
-# Initialize clients
-control_client = boto3.client("bedrock-agentcore-control", region_name="us-west-2")
-data_client = boto3.client("bedrock-agentcore", region_name="us-west-2")
-
-# Wait for memory to become active
-print("Waiting for memory to become active...")
-while True:
-    response = control_client.get_memory(memoryId=memory_id)
-    status = response["memory"]["status"]
-    if status == "ACTIVE":
-        print("✓ Memory is active!")
-        break
-    print(f"  Status: {status}, waiting...")
-    time.sleep(5)
-
-# Add diverse events to build long-term memory
-print("\nAdding diverse conversation to memory...")
-payload = [
-    {"conversational": {"content": {"text": "I really enjoy drinking tea, especially black tea"}, "role": "USER"}},
-    {"conversational": {"content": {"text": "That's a classic choice! How do you take your tea?"}, "role": "ASSISTANT"}},
-    {"conversational": {"content": {"text": "I prefer it with no milk or sugar, just plain"}, "role": "USER"}},
-    {"conversational": {"content": {"text": "Pure and simple - that's the best way to taste the tea itself."}, "role": "ASSISTANT"}},
-    {"conversational": {"content": {"text": "I'm a big fan of Python programming"}, "role": "USER"}},
-    {"conversational": {"content": {"text": "Python is a great language! What do you use it for?"}, "role": "ASSISTANT"}},
-    {"conversational": {"content": {"text": "Mostly for building AI agents and working with AWS services"}, "role": "USER"}},
-    {"conversational": {"content": {"text": "That's an excellent combination for modern development."}, "role": "ASSISTANT"}},
-    {"conversational": {"content": {"text": "I'm from Brisbane, Australia"}, "role": "USER"}},
-    {"conversational": {"content": {"text": "Brisbane is a beautiful city! Great weather there."}, "role": "ASSISTANT"}},
-]
-
-data_client.create_event(
-    memoryId=memory_id,
-    actorId=actor_id,
-    sessionId=session_id,
-    eventTimestamp=datetime.now(),
-    payload=payload,
+try:
+    import orjson
+except ImportError:  # stdlib fallback; json.loads also accepts bytes
+    import json as orjson
+
+from _aws import get_control_client, get_data_client
+
+# Seed conversation: turns alternate USER / ASSISTANT, starting with USER
+ROLES = ("USER", "ASSISTANT")
+TURNS = (
+    "I really enjoy drinking tea, especially black tea",
+    "That's a classic choice! How do you take your tea?",
+    "I prefer it with no milk or sugar, just plain",
+    "Pure and simple - that's the best way to taste the tea itself.",
+    "I'm a big fan of Python programming",
+    "Python is a great language! What do you use it for?",
+    "Mostly for building AI agents and working with AWS services",
+    "That's an excellent combination for modern development.",
+    "I'm from Brisbane, Australia",
+    "Brisbane is a beautiful city! Great weather there.",
 )
 
-print("✓ Events added successfully!")
-
-# Wait for long-term memory extraction
-print("\nWaiting for long-term memories to be extracted...")
-print("(This happens asynchronously and may take a few minutes)")
-time.sleep(60)
-
-# Query long-term memories
-print("\nQuerying long-term memories...")
-namespace = f"/preferences/{actor_id}"
-
-queries = [
-    "What do I like to drink?",
-    "What programming language do I use?",
-    "Where am I from?",
-]
-
-for query_text in queries:
-    print(f"\nQuery: '{query_text}'")
-    print("-" * 60)
-    
-    response = data_client.retrieve_memory_records(
-        memoryId=memory_id,
-        namespace=namespace,
-        searchCriteria={"searchQuery": query_text, "topK": 2},
+
+def backoff_delay(attempt, initial, cap):
+    """Exponential backoff: initial, 2*initial, 4*initial, ... capped at cap."""
+    return min(cap, initial * 2**attempt)
+
+
+async def wait_for_active(client, memory_id, initial=0.5, cap=8.0, timeout=300):
+    """Poll get_memory with backoff; True once ACTIVE, False after ``timeout`` seconds.
+
+    Raises RuntimeError if the memory is FAILED or being deleted, since it will
+    never become active.
+    """
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    while True:
+        response = await asyncio.to_thread(client.get_memory, memoryId=memory_id)
+        status = response["memory"]["status"]
+        if status == "ACTIVE":
+            return True
+        if status in ("FAILED", "DELETING"):
+            raise RuntimeError(f"Memory {memory_id} is {status}")
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        print(f"  Status: {status}, waiting...")
+        await asyncio.sleep(min(backoff_delay(attempt, initial, cap), remaining))
+        attempt += 1
+
+
+def has_records(client, memory_id, namespace, expected_k=1):
+    """True if the namespace already holds at least expected_k memory records."""
+    response = client.list_memory_records(
+        memoryId=memory_id, namespace=namespace, maxResults=expected_k
     )
-    
-    records = response.get("memoryRecordSummaries", [])
-    
-    if records:
-        for i, record in enumerate(records, 1):
-            content = record.get("content", {})
-            print(f"{i}. {content.get('text', 'No text')}")
+    return len(response.get("memoryRecordSummaries", [])) >= expected_k
+
+
+def seed_flag_path(memory_id, actor_id, session_id, payload):
+    """Sentinel file name derived from a hash of everything create_event sends."""
+    canonical = json.dumps(
+        {
+            "memory_id": memory_id,
+            "actor_id": actor_id,
+            "session_id": session_id,
+            "payload": payload,
+        },
+        sort_keys=True,
+    )
+    digest = hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+    return f"memory_seeded_{digest}.flag"
+
+
+async def wait_for_extraction(
+    client, memory_id, namespace, expected_k=1, initial=1.0, cap=15.0, timeout=180
+):
+    """Poll for extracted records with backoff; True once expected_k exist.
+
+    Returns as soon as extraction lands instead of sleeping a fixed time, and
+    gives up (False) after ``timeout`` seconds rather than waiting forever.
+    """
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    while True:
+        if await asyncio.to_thread(has_records, client, memory_id, namespace, expected_k):
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        await asyncio.sleep(min(backoff_delay(attempt, initial, cap), remaining))
+        attempt += 1
+
+
+async def main():
+    # Load memory configuration
+    with open("memory_config.json", "rb") as f:
+        config = orjson.loads(f.read())
+
+    memory_id = config["memory_id"]
+    actor_id = "user-1"
+    session_id = "session-3"
+
+    # Initialize clients
+    control_client = get_control_client()
+    data_client = get_data_client()
+
+    # Wait for memory to become active
+    print("Waiting for memory to become active...")
+    try:
+        active = await wait_for_active(control_client, memory_id)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return
+    if not active:
+        print("❌ Memory did not become active in time")
+        return
+    print("✓ Memory is active!")
+
+    payload = [
+        {"conversational": {"content": {"text": text}, "role": ROLES[i & 1]}}
+        for i, text in enumerate(TURNS)
+    ]
+    namespace = f"/preferences/{actor_id}"
+
+    # Re-runs with the same payload skip ingestion and the extraction wait,
+    # as long as the records from the earlier run are still there
+    flag_path = seed_flag_path(memory_id, actor_id, session_id, payload)
+    if os.path.exists(flag_path) and has_records(data_client, memory_id, namespace):
+        print("\n✓ Conversation already seeded, skipping event ingestion")
     else:
-        print("No memories found yet (extraction may still be in progress)")
+        # Add diverse events to build long-term memory
+        print("\nAdding diverse conversation to memory...")
+        data_client.create_event(
+            memoryId=memory_id,
+            actorId=actor_id,
+            sessionId=session_id,
+            eventTimestamp=datetime.now(),
+            payload=payload,
+        )
+
+        print("✓ Events added successfully!")
+
+        # Only mark as seeded once create_event has succeeded
+        with open(flag_path, "w") as f:
+            f.write(memory_id)
+
+        # Wait for long-term memory extraction
+        print("\nWaiting for long-term memories to be extracted...")
+        print("(This happens asynchronously and may take a few minutes)")
+        if await wait_for_extraction(data_client, memory_id, namespace):
+            print("✓ Long-term memories extracted!")
+        else:
+            print("⚠ Extraction still in progress, querying anyway")
+
+    # Query long-term memories
+    print("\nQuerying long-term memories...")
+
+    queries = [
+        "What do I like to drink?",
+        "What programming language do I use?",
+        "Where am I from?",
+    ]
+
+    # Bind the per-run arguments once; only the search criteria vary per query.
+    # Each query gets its own criteria dict because the calls run concurrently.
+    retrieve_records = functools.partial(
+        data_client.retrieve_memory_records, memoryId=memory_id, namespace=namespace
+    )
+
+    def retrieve(query_text):
+        response = retrieve_records(
+            searchCriteria={"searchQuery": query_text, "topK": 2}
+        )
+        return response.get("memoryRecordSummaries", [])
+
+    # Issue all queries concurrently: total latency is the slowest call, not the sum
+    results = await asyncio.gather(
+        *(asyncio.to_thread(retrieve, query_text) for query_text in queries)
+    )
+
+    for query_text, records in zip(queries, results):
+        print(f"\nQuery: '{query_text}'")
+        print("-" * 60)
+
+        if records:
+            for i, record in enumerate(records, 1):
+                content = record.get("content", {})
+                print(f"{i}. {content.get('text', 'No text')}")
+        else:
+            print("No memories found yet (extraction may still be in progress)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,60 +2,141 @@
 Example 7: Agent with long-term memory retrieval
 """
 import asyncio
-import json
-from datetime import datetime
-from strands import Agent, tool
-from bedrock_agentcore.memory.integrations.strands.session_manager import AgentCoreMemorySessionManager
-from bedrock_agentcore.memory.integrations.strands.config import AgentCoreMemoryConfig, RetrievalConfig
+from functools import lru_cache
+import time
 
+try:
+    import orjson
+except ImportError:  # stdlib fallback; json.loads also accepts bytes
+    import json as orjson
 
-@tool
-def get_time(timezone: str = "UTC") -> str:
-    """Get the current time for a timezone."""
-    current_time = datetime.now().strftime("%I:%M:%S %p")
-    return f"The current time in {timezone} is {current_time}"
+try:
+    from prompt_toolkit import PromptSession
+except ImportError:  # optional; falls back to the built-in input()
+    PromptSession = None
+
+
+@lru_cache(maxsize=1)
+def format_current_time(second: int) -> str:
+    """Format a local time; repeated tool calls within one second reuse the string."""
+    return time.strftime("%I:%M:%S %p", time.localtime(second))
+
+
+def normalize_query(text: str) -> str:
+    """Key for the prefetch table: case- and whitespace-insensitive."""
+    return " ".join(text.lower().split())
+
+
+async def read_line(prompt_session, message):
+    """Read one line without starving background tasks where possible."""
+    if prompt_session is not None:
+        return await prompt_session.prompt_async(message)
+    # Let pending prefetch tasks hand their work to a thread before input()
+    # blocks the event loop
+    await asyncio.sleep(0)
+    return input(message)
 
 
 async def main():
     # Load memory configuration
-    with open("memory_config.json", "r") as f:
-        config = json.load(f)
+    with open("memory_config.json", "rb") as f:
+        config = orjson.loads(f.read())
 
     memory_id = config["memory_id"]
     actor_id = "user-1"
     session_id = "session-3"
 
-    # Create memory configuration with long-term retrieval
+    print("Time Agent with Long-Term Memory CLI (type 'quit' to exit)")
+    print("-" * 60)
+    print("The agent looks up relevant long-term memories when it needs them!\n")
+
+    # Heavy SDK imports are deferred until after the banner is shown
+    from strands import Agent, tool
+    from bedrock_agentcore.memory.integrations.strands.session_manager import AgentCoreMemorySessionManager
+    from bedrock_agentcore.memory.integrations.strands.config import AgentCoreMemoryConfig
+
+    from _aws import CLIENT_CONFIG, REGION, SESSION, get_data_client, get_runtime_client
+    from semantic_cache import SemanticCache, titan_embedder
+
+    @tool
+    def get_time(timezone: str = "UTC") -> str:
+        """Get the current time for a timezone."""
+        current_time = format_current_time(int(time.time()))
+        return f"The current time in {timezone} is {current_time}"
+
+    data_client = get_data_client()
+    namespace = f"/preferences/{actor_id}"
+
+    # The agent tends to look up the same facts again over a conversation;
+    # a restated question is answered locally instead of another round-trip
+    cache = SemanticCache(titan_embedder(get_runtime_client()), threshold=0.92)
+
+    def retrieve(query):
+        def fetch():
+            response = data_client.retrieve_memory_records(
+                memoryId=memory_id,
+                namespace=namespace,
+                searchCriteria={"searchQuery": query, "topK": 3},
+            )
+            return response.get("memoryRecordSummaries", [])
+
+        return cache.get_or_fetch(query, fetch, scope=(memory_id, namespace))
+
+    # Long-term memories come in as tool results rather than being spliced into
+    # the prompt each turn, so the system prompt stays cacheable turn to turn
+    # Memories for the last user message, fetched while the user types the next
+    prefetched = {}
+    prefetch_tasks = set()
+
+    def prefetch(text):
+        try:
+            prefetched[normalize_query(text)] = retrieve(text)
+        except Exception:
+            pass  # Only a head start; the tool retrieves again if needed
+
+    @tool
+    def lookup_user_context(query: str) -> str:
+        """Look up what is known about the user (preferences, background) relevant to a query."""
+        records = prefetched.pop(normalize_query(query), None)
+        if records is None:
+            records = retrieve(query)
+        texts = [record.get("content", {}).get("text", "") for record in records]
+        return "\n".join(text for text in texts if text) or "No relevant user context found."
+
+    # Create memory configuration (short-term events; long-term via the tool)
     memory_config = AgentCoreMemoryConfig(
         memory_id=memory_id,
-        actor_id="user-1",
+        actor_id=actor_id,
         session_id="session-4",
-        retrieval_config={
-            f"/preferences/{actor_id}": RetrievalConfig(top_k=3)
-        },
     )
 
     # Create memory session manager
     session_manager = AgentCoreMemorySessionManager(
         agentcore_memory_config=memory_config,
-        region_name="us-west-2",
+        region_name=REGION,
+        boto_session=SESSION,
+        boto_client_config=CLIENT_CONFIG,
     )
 
     # Create agent with long-term memory
     agent = Agent(
         name="TimeAgentWithLongTermMemory",
-        tools=[get_time],
-        system_prompt="You are a helpful time assistant. Use context about the user to personalize responses.",
+        tools=[get_time, lookup_user_context],
+        system_prompt=(
+            "You are a helpful time assistant. Use the lookup_user_context tool "
+            "to recall context about the user and personalize responses."
+        ),
         session_manager=session_manager,
         callback_handler=None,
     )
 
-    print("Time Agent with Long-Term Memory CLI (type 'quit' to exit)")
-    print("-" * 60)
-    print("The agent automatically retrieves relevant long-term memories!\n")
+    prompt_session = PromptSession() if PromptSession is not None else None
 
     while True:
-        user_input = input("\nYou: ").strip()
+        try:
+            user_input = (await read_line(prompt_session, "\nYou: ")).strip()
+        except (KeyboardInterrupt, EOFError):
+            break
 
         if user_input.lower() == "quit":
             break
@@ -64,6 +145,11 @@ async def main():
             response = await agent.invoke_async(user_input)
             print(f"\nAgent: {response}")
 
+            # Follow-up questions tend to be about the same topic
+            task = asyncio.create_task(asyncio.to_thread(prefetch, user_input))
+            prefetch_tasks.add(task)
+            task.add_done_callback(prefetch_tasks.discard)
+
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,42 +1,82 @@
 """
 Example 9: Clean up and delete the Memory resource
 """
-import boto3
-import json
 import os
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback; json.loads also accepts bytes
+    import json as orjson
+
+from _aws import get_control_client
 
 # Load memory configuration
 try:
-    with open("memory_config.json", "r") as f:
-        config = json.load(f)
+    with open("memory_config.json", "rb") as f:
+        config = orjson.loads(f.read())
     memory_id = config["memory_id"]
 except FileNotFoundError:
     print("❌ No memory_config.json found. Nothing to clean up.")
     exit(0)
 
 # Initialize AgentCore control client
-control_client = boto3.client("bedrock-agentcore-control", region_name="us-west-2")
+control_client = get_control_client()
 
 print(f"Deleting memory: {memory_id}")
 
+# Start the delete request on a daemon thread and, while it is in flight, move
+# the config file aside. A daemon thread doesn't hold up interpreter exit, so
+# the timeout below really gives control back.
+outcome = {}
+
+
+def delete():
+    try:
+        control_client.delete_memory(memoryId=memory_id)
+        outcome["status"] = "deleted"
+    except control_client.exceptions.ResourceNotFoundException:
+        outcome["status"] = "not_found"
+    except Exception as e:
+        outcome["error"] = e
+
+
+worker = threading.Thread(target=delete, daemon=True)
+worker.start()
+
+backup_path = f"memory_config.json.deleted.{int(time.time())}"
+os.replace("memory_config.json", backup_path)
+
+# Set once the backup has been dealt with; anything else (an error, Ctrl-C)
+# puts the configuration back so the cleanup can be retried
+settled = False
 try:
-    # Delete the memory resource
-    control_client.delete_memory(memoryId=memory_id)
-    print(f"✓ Memory {memory_id} deleted successfully!")
-    
+    worker.join(timeout=10)
+
+    if worker.is_alive():
+        # Outcome unknown: keep the backup, it is the only local record of the id
+        print(f"⚠ Delete request for {memory_id} did not complete within 10s")
+        print(f"  Configuration kept at {backup_path}; check the memory status before removing it")
+        settled = True
+        exit(1)
+
+    if "error" in outcome:
+        print(f"❌ Error during cleanup: {str(outcome['error'])}")
+        exit(1)
+
+    if outcome["status"] == "deleted":
+        print(f"✓ Memory {memory_id} deleted successfully!")
+    else:
+        print(f"⚠ Memory {memory_id} not found (may have been already deleted)")
+
     # Remove the configuration file
-    os.remove("memory_config.json")
+    os.remove(backup_path)
+    settled = True
     print("✓ Configuration file removed")
-    
-    print("\n✓ Cleanup complete!")
-    
-except control_client.exceptions.ResourceNotFoundException:
-    print(f"⚠ Memory {memory_id} not found (may have been already deleted)")
-    # Still remove the config file
-    if os.path.exists("memory_config.json"):
-        os.remove("memory_config.json")
-        print("✓ Configuration file removed")
-        
-except Exception as e:
-    print(f"❌ Error during cleanup: {str(e)}")
-    exit(1)
+
+finally:
+    if not settled:
+        os.replace(backup_path, "memory_config.json")
+
+print("\n✓ Cleanup complete!")
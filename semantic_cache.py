@@ -0,0 +1,170 @@
+"""
+Client-side semantic cache for AgentCore long-term memory retrieval.
+
+Queries are embedded and compared by cosine similarity against queries that
+were already answered; a close enough match returns the cached memory records
+without another ``retrieve_memory_records`` round-trip.
+"""
+
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional C-accelerated JSON; stdlib json is the fallback
+    orjson = None
+
+TITAN_EMBED_MODEL_ID = "amazon.titan-embed-text-v2:0"
+
+
+def titan_embedder(runtime_client) -> Callable[[str], Sequence[float]]:
+    """Build an embedding function backed by Titan Text Embeddings v2."""
+
+    def embed(text: str) -> Sequence[float]:
+        response = runtime_client.invoke_model(
+            modelId=TITAN_EMBED_MODEL_ID,
+            body=json.dumps({"inputText": text, "normalize": True}),
+        )
+        body = response["body"].read()
+        return (orjson.loads(body) if orjson else json.loads(body))["embedding"]
+
+    return embed
+
+
+def _quantize(vector: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Symmetric per-vector int8 quantization: ``vector ~= codes * scale``."""
+    peak = float(np.abs(vector).max())
+    scale = peak / 127 if peak else 1.0
+    return np.round(vector / scale).astype(np.int8), scale
+
+
+class _Partition:
+    """Entries of one cache scope in structure-of-arrays layout.
+
+    Embeddings live in a single preallocated ``int8[capacity, D]`` matrix with a
+    ``float32`` scale per row (a quarter of the float32 footprint), so a lookup
+    is one matrix-vector product instead of a Python loop.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.size = 0
+        self.emb: Optional[np.ndarray] = None  # allocated once D is known
+        self.scale = np.zeros(capacity, np.float32)
+        self.expires = np.zeros(capacity)
+        self.last_used = np.zeros(capacity)
+        self.keys: List[Optional[str]] = [None] * capacity
+        self.vals: List[Any] = [None] * capacity
+        self.index: Dict[str, int] = {}
+
+    def get(self, query: str, now: float) -> Optional[Any]:
+        row = self.index.get(query)
+        if row is None or self.expires[row] <= now:
+            return None
+        self.last_used[row] = now
+        return self.vals[row]
+
+    def nearest(self, embedding: np.ndarray, now: float, threshold: float):
+        if not self.size:
+            return None
+        query_q, query_scale = _quantize(embedding)
+        # int8 codes are exact in float32 and |sum| < 2**24 for D <= 1024,
+        # so the float32 BLAS product reproduces the integer dot product
+        scores = self.emb[: self.size].astype(np.float32) @ query_q.astype(np.float32)
+        scores *= self.scale[: self.size] * query_scale
+        scores[self.expires[: self.size] <= now] = -np.inf
+        row = int(scores.argmax())
+        if scores[row] < threshold:
+            return None
+        self.last_used[row] = now
+        return self.vals[row]
+
+    def put(
+        self, query: str, embedding: np.ndarray, value: Any, now: float, ttl: float
+    ):
+        row = self.index.get(query)
+        if row is None:
+            if self.emb is None:
+                self.emb = np.empty((self.capacity, embedding.shape[0]), np.int8)
+            if self.size < self.capacity:
+                row = self.size
+                self.size += 1
+            else:
+                # Reuse an expired slot if there is one, else evict the LRU entry
+                stale = self.expires <= now
+                row = int(np.where(stale, -np.inf, self.last_used).argmin())
+                del self.index[self.keys[row]]
+            self.index[query] = row
+            self.keys[row] = query
+
+        self.emb[row], self.scale[row] = _quantize(embedding)
+        self.vals[row] = value
+        self.expires[row] = now + ttl
+        self.last_used[row] = now
+
+
+class SemanticCache:
+    """TTL + LRU cache of retrieval results keyed by query embedding.
+
+    Entries are partitioned by ``scope``; ``maxsize`` bounds each partition.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], Sequence[float]],
+        threshold: float = 0.85,
+        maxsize: int = 512,
+        ttl: float = 300,
+    ):
+        self._embed = embed_fn
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._partitions: Dict[Hashable, _Partition] = {}
+        self._lock = threading.Lock()
+
+    def get_or_fetch(
+        self, query: str, fetch: Callable[[], Any], scope: Hashable = None
+    ) -> Any:
+        """Return a cached result for a similar query, or call ``fetch`` and cache it."""
+        with self._lock:
+            partition = self._partitions.get(scope)
+            if partition is not None:
+                hit = partition.get(query, time.monotonic())
+                if hit is not None:
+                    return hit
+
+        try:
+            embedding = self._normalize(self._embed(query))
+        except Exception:
+            # Embedding is an optimisation only; never block retrieval on it
+            return fetch()
+
+        with self._lock:
+            partition = self._partitions.get(scope)
+            if partition is not None:
+                hit = partition.nearest(embedding, time.monotonic(), self.threshold)
+                if hit is not None:
+                    return hit
+
+        result = fetch()
+        with self._lock:
+            partition = self._partitions.setdefault(scope, _Partition(self.maxsize))
+            partition.put(query, embedding, result, time.monotonic(), self.ttl)
+        return result
+
+    def clear(self):
+        """Drop every cached entry."""
+        with self._lock:
+            self._partitions.clear()
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> np.ndarray:
+        # Unit length so a dot product is the cosine similarity
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
@@ -5,9 +5,41 @@ Setup Verification Script for Agent Memory Management Application
 This script verifies that all prerequisites are met before running the application.
 """
 
+import configparser
+import os
+import re
 import sys
-import subprocess
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, distribution
+
+# A whole-line "[name]" section header; commented-out headers don't match
+SECTION_RE = re.compile(r"^\s*\[([^\]]+)\]\s*$", re.M)
+
+# AWS error code -> (message, check passed) for the STS credential probe
+CREDENTIAL_ERRORS = {
+    "UnrecognizedClientException": ("❌ Invalid AWS credentials for 'default' profile", False),
+    "InvalidClientTokenId": ("❌ Invalid AWS credentials for 'default' profile", False),
+    "SignatureDoesNotMatch": ("❌ Invalid AWS credentials for 'default' profile", False),
+    "ExpiredToken": ("❌ AWS credentials for 'default' profile have expired", False),
+}
+
+# AWS error code -> (message, check passed) for the AgentCore probe
+AGENTCORE_ERRORS = {
+    "AccessDenied": ("⚠️  Bedrock AgentCore accessible but may need IAM permissions", True),
+    "AccessDeniedException": ("⚠️  Bedrock AgentCore accessible but may need IAM permissions", True),
+    "UnauthorizedOperation": ("⚠️  Bedrock AgentCore accessible but may need IAM permissions", True),
+    "UnrecognizedClientException": ("❌ Invalid AWS credentials for 'default' profile", False),
+    "InvalidClientTokenId": ("❌ Invalid AWS credentials for 'default' profile", False),
+    "InvalidSignatureException": ("❌ Invalid AWS credentials for 'default' profile", False),
+    "SignatureDoesNotMatch": ("❌ Invalid AWS credentials for 'default' profile", False),
+}
+
+# AWS error code -> message for the Bedrock Runtime probe
+RUNTIME_ERRORS = {
+    "AccessDenied": "⚠️  Bedrock Runtime accessible but may need model access",
+    "AccessDeniedException": "⚠️  Bedrock Runtime accessible but may need model access",
+}
 
 
 def check_python_version():
@@ -25,19 +57,21 @@ def check_python_version():
 def check_dependencies():
     """Check if required packages are installed."""
     print("\nChecking dependencies...")
-    required = [
-        "streamlit",
-        "boto3",
-        "strands",
-        "bedrock_agentcore",
-    ]
+    # Import name -> distribution name; only package metadata is read, so
+    # none of these (potentially slow to import) modules are executed
+    required = {
+        "streamlit": "streamlit",
+        "boto3": "boto3",
+        "strands": "strands-agents",
+        "bedrock_agentcore": "bedrock-agentcore",
+    }
     
     missing = []
-    for package in required:
+    for package, dist_name in required.items():
         try:
-            __import__(package.replace("-", "_"))
-            print(f"✅ {package} installed")
-        except ImportError:
+            version = distribution(dist_name).version
+            print(f"✅ {package} {version} installed")
+        except PackageNotFoundError:
             print(f"❌ {package} not found")
             missing.append(package)
     
@@ -49,26 +83,37 @@ def check_dependencies():
     return True
 
 
+@lru_cache(maxsize=None)
+def read_aws_files():
+    """Read ~/.aws/credentials and ~/.aws/config once, shared by all checks."""
+    aws_dir = os.path.expanduser("~/.aws")
+    contents = {}
+    for name in ("credentials", "config"):
+        path = os.path.join(aws_dir, name)
+        if os.path.exists(path):
+            with open(path) as f:
+                contents[name] = f.read()
+    return aws_dir, contents
+
+
 def check_aws_credentials():
     """Check if AWS credentials are configured."""
     print("\nChecking AWS credentials...")
-    aws_dir = Path.home() / ".aws"
-    credentials_file = aws_dir / "credentials"
-    config_file = aws_dir / "config"
+    aws_dir, contents = read_aws_files()
+    credentials = contents.get("credentials")
     
-    if not credentials_file.exists():
+    if credentials is None:
         print("❌ AWS credentials file not found")
-        print(f"   Expected: {credentials_file}")
+        print(f"   Expected: {os.path.join(aws_dir, 'credentials')}")
         print("   Run: aws configure")
         return False
     
     print(f"✅ AWS credentials file found")
     
-    # Check for required profiles
-    with open(credentials_file, "r") as f:
-        content = f.read()
-        has_default = "[default]" in content
-        has_llm = "[default-xavi]" in content
+    # Check for required profiles (exact section headers, not substrings)
+    sections = {name.strip() for name in SECTION_RE.findall(credentials)}
+    has_default = "default" in sections
+    has_llm = "default-xavi" in sections
     
     if has_default:
         print("✅ Profile 'default' found")
@@ -87,61 +132,103 @@ def check_aws_credentials():
 def check_aws_region():
     """Check if AWS region is configured."""
     print("\nChecking AWS region configuration...")
-    config_file = Path.home() / ".aws" / "config"
+    _, contents = read_aws_files()
     
-    if not config_file.exists():
+    if "config" not in contents:
         print("⚠️  AWS config file not found")
         print("   Region can be set via environment variable: AWS_DEFAULT_REGION=eu-west-1")
         return True  # Not critical
     
-    with open(config_file, "r") as f:
-        content = f.read()
-        if "region" in content:
-            print("✅ AWS region configured")
-            return True
-        else:
-            print("⚠️  No region found in config")
-            print("   Set via: aws configure set region eu-west-1")
-            return True  # Not critical
+    config = configparser.ConfigParser(interpolation=None, strict=False)
+    try:
+        config.read_string(contents["config"])
+    except configparser.Error:
+        pass  # Unparseable file: treat it as having no region
+    
+    if any(config.has_option(section, "region") for section in config.sections()):
+        print("✅ AWS region configured")
+        return True
+    else:
+        print("⚠️  No region found in config")
+        print("   Set via: aws configure set region eu-west-1")
+        return True  # Not critical
 
 
-def check_bedrock_access():
-    """Check if Bedrock services are accessible."""
+def check_bedrock_access(deep=False):
+    """Check if AWS credentials work, and with ``deep`` if Bedrock services are accessible."""
     print("\nChecking AWS Bedrock access...")
     try:
         import boto3
+        from botocore.config import Config
+        from botocore.exceptions import ClientError, ProfileNotFound
         
-        # Test default profile
+        # Fail fast: one attempt with short timeouts bounds the worst case
+        probe_config = Config(
+            connect_timeout=2, read_timeout=5, retries={"max_attempts": 1}
+        )
+        
+        # Credentials first: GetCallerIdentity needs no IAM permissions and
+        # returns a few hundred bytes, so it is the cheapest possible probe
         try:
             session = boto3.Session(profile_name="default", region_name="eu-west-1")
-            client = session.client("bedrock-agentcore-control")
+            identity = session.client("sts", config=probe_config).get_caller_identity()
+            print(f"✅ AWS credentials valid for 'default' profile (account {identity['Account']})")
+        except ClientError as e:
+            code = e.response["Error"]["Code"]
+            message, passed = CREDENTIAL_ERRORS.get(
+                code, (f"⚠️  Could not verify AWS credentials: {code}", True)
+            )
+            print(message)
+            return passed
+        except Exception as e:
+            print(f"⚠️  Could not verify AWS credentials: {str(e)[:100]}")
+            return True
+        
+        if not deep:
+            print("   Run with --deep to also probe Bedrock AgentCore and Bedrock Runtime")
+            return True
+        
+        def probe_agentcore():
+            client = session.client("bedrock-agentcore-control", config=probe_config)
             # Try to list memories (will fail if no permissions, but that's ok)
             client.list_memories(maxResults=1)
+        
+        def probe_runtime():
+            session = boto3.Session(profile_name="default-xavi", region_name="eu-west-1")
+            client = session.client("bedrock", config=probe_config)
+            client.list_foundation_models(byProvider="anthropic")
+        
+        # Both probes are independent network round-trips; run them together
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            agentcore_probe = executor.submit(probe_agentcore)
+            runtime_probe = executor.submit(probe_runtime)
+        
+        # Test default profile
+        try:
+            agentcore_probe.result()
             print("✅ Bedrock AgentCore accessible with 'default' profile")
-        except Exception as e:
-            error_msg = str(e)
-            if "AccessDenied" in error_msg or "UnauthorizedOperation" in error_msg:
-                print("⚠️  Bedrock AgentCore accessible but may need IAM permissions")
-            elif "InvalidClientTokenId" in error_msg or "SignatureDoesNotMatch" in error_msg:
-                print("❌ Invalid AWS credentials for 'default' profile")
+        except ClientError as e:
+            code = e.response["Error"]["Code"]
+            message, passed = AGENTCORE_ERRORS.get(
+                code, (f"⚠️  Could not verify Bedrock access: {code}", True)
+            )
+            print(message)
+            if not passed:
                 return False
-            else:
-                print(f"⚠️  Could not verify Bedrock access: {error_msg[:100]}")
+        except Exception as e:
+            print(f"⚠️  Could not verify Bedrock access: {str(e)[:100]}")
         
         # Test LLM profile
         try:
-            session = boto3.Session(profile_name="default-xavi", region_name="eu-west-1")
-            client = session.client("bedrock")
-            client.list_foundation_models(byProvider="anthropic")
+            runtime_probe.result()
             print("✅ Bedrock Runtime accessible with 'default-xavi' profile")
+        except ProfileNotFound:
+            print("⚠️  Profile 'default-xavi' not found (optional for testing)")
+        except ClientError as e:
+            code = e.response["Error"]["Code"]
+            print(RUNTIME_ERRORS.get(code, f"⚠️  Could not verify Bedrock Runtime: {code}"))
         except Exception as e:
-            error_msg = str(e)
-            if "ProfileNotFound" in error_msg:
-                print("⚠️  Profile 'default-xavi' not found (optional for testing)")
-            elif "AccessDenied" in error_msg:
-                print("⚠️  Bedrock Runtime accessible but may need model access")
-            else:
-                print(f"⚠️  Could not verify Bedrock Runtime: {error_msg[:100]}")
+            print(f"⚠️  Could not verify Bedrock Runtime: {str(e)[:100]}")
         
         return True
         
@@ -155,6 +242,8 @@ def check_bedrock_access():
 
 def main():
     """Run all verification checks."""
+    deep = "--deep" in sys.argv[1:]
+    
     print("=" * 60)
     print("Agent Memory Management - Setup Verification")
     print("=" * 60)
@@ -164,7 +253,7 @@ def main():
         ("Dependencies", check_dependencies()),
         ("AWS Credentials", check_aws_credentials()),
         ("AWS Region", check_aws_region()),
-        ("Bedrock Access", check_bedrock_access()),
+        ("Bedrock Access", check_bedrock_access(deep)),
     ]
     
     print("\n" + "=" * 60)